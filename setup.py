@@ -1,52 +1,6 @@
 """
-Setup script for VisionStream
+Setup shim for VisionStream - all metadata lives in pyproject.toml.
 """
-from setuptools import setup, find_packages
-from pathlib import Path
+from setuptools import setup
 
-# Read README for long description
-readme_file = Path(__file__).parent / "README.md"
-long_description = readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
-
-# Read requirements
-requirements_file = Path(__file__).parent / "requirements.txt"
-requirements = []
-if requirements_file.exists():
-    requirements = [
-        line.strip()
-        for line in requirements_file.read_text(encoding="utf-8").splitlines()
-        if line.strip() and not line.startswith("#")
-    ]
-
-setup(
-    name="visionstream",
-    version="1.0.0",
-    author="VisionStream Team",
-    description="High-Performance RTSP Desktop Client",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/yehuditOutmazgin/vision-stream",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "Intended Audience :: End Users/Desktop",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: Microsoft :: Windows",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Topic :: Multimedia :: Video",
-        "Topic :: Multimedia :: Video :: Display",
-    ],
-    python_requires=">=3.10",
-    install_requires=requirements,
-    entry_points={
-        "console_scripts": [
-            "visionstream=main:main",
-        ],
-    },
-    include_package_data=True,
-    zip_safe=False,
-)
+setup()
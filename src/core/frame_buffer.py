@@ -2,134 +2,261 @@
 Frame Buffer Manager - Implements Latest Frame Policy with watchdog.
 """
 
-import threading
+import os
 import time
-from typing import Optional, Callable
+import weakref
+from typing import Optional, List
 import numpy as np
+from PySide6.QtCore import QObject, QTimer, Signal
 from utils.logger import get_logger
 from utils.config import Config
 
+# Bound once at import so the per-frame path skips the module attribute lookup
+_monotonic_ns = time.monotonic_ns
+# PyAV's to_ndarray returns exactly np.ndarray, so validation can use an identity check
+_ndarray = np.ndarray
+
+# Watchdog settings converted once to the units the scheduler works in
+_WATCHDOG_TIMEOUT_NS = int(Config.WATCHDOG_TIMEOUT * 1e9)
+_WATCHDOG_MIN_INTERVAL_MS = int(Config.WATCHDOG_CHECK_INTERVAL * 1000)
+
+# Opt-in frame validation for external producers (stripped entirely under python -O)
+_VALIDATE_FRAMES = os.environ.get("VISIONSTREAM_VALIDATE_FRAMES") == "1"
+
+
+class _FrameBufferSignals(QObject):
+    """Qt signals for FrameBuffer (composed, so FrameBuffer itself stays a plain class)."""
+
+    frame_ready = Signal()  # A new frame was published
+    timeout = Signal()      # Watchdog timeout - no frames received
+
 
 class FrameBuffer:
     """
     Single-frame buffer with Latest Frame Policy.
     Implements watchdog mechanism for stream monitoring.
-    Thread-safe with daemon watchdog thread.
+    The watchdog runs on the GUI thread via a shared QTimer (see _WatchdogScheduler).
+
+    Frames are published through a two-slot double buffer: the producer writes
+    the inactive slot and then flips the active index, so readers never take a lock.
+    frame_ready notifications are coalesced: at most one is in flight until the
+    consumer calls take_frame(), so a stalled GUI never builds up a signal backlog.
     """
 
+    __slots__ = (
+        "logger", "_slots", "_active",
+        "last_frame_time_ns", "watchdog_active", "signals", "_notify_pending",
+        "frames_dropped", "__weakref__",
+    )
+
     def __init__(self):
         self.logger = get_logger()
-        self.current_frame: Optional[np.ndarray] = None
-        self.frame_lock = threading.Lock()
+        # Double buffer: the producer fills the inactive slot, then publishes it
+        # by flipping the active index (a single int store, atomic under the GIL)
+        self._slots: List[Optional[np.ndarray]] = [None, None]
+        self._active = 0
         
-        # Watchdog
-        self.last_frame_time = time.time()
-        self.watchdog_running = False
-        self.watchdog_thread: Optional[threading.Thread] = None
+        # Watchdog (monotonic nanosecond timestamp of the last frame)
+        self.last_frame_time_ns = time.monotonic_ns()
+        self.watchdog_active = False
         
-        # Callbacks (thread-safe)
-        self.on_frame_ready: Optional[Callable] = None
-        self.on_timeout: Optional[Callable] = None
+        # Signals - connect frame_ready with Qt.QueuedConnection when the
+        # producer runs on a worker thread
+        self.signals = _FrameBufferSignals()
+        # True while a frame_ready notification has not been consumed by take_frame()
+        self._notify_pending = False
+        # Frames overwritten before the consumer took them
+        self.frames_dropped = 0
 
     def put_frame(self, frame: np.ndarray):
         """
-        Put a new frame into the buffer.
+        Put a new frame into the buffer (entry point for external producers).
+        Validates the frame when VISIONSTREAM_VALIDATE_FRAMES=1, then publishes
+        it via put_frame_unchecked().
+        
+        Args:
+            frame: NumPy array from PyAV (Config.DISPLAY_PIXEL_FORMAT)
+        """
+        if __debug__ and _VALIDATE_FRAMES:
+            if type(frame) is not _ndarray:
+                self.logger.log_error("INVALID_FRAME", f"Rejected frame of type {type(frame).__name__}")
+                return
+        self.put_frame_unchecked(frame)
+
+    def put_frame_unchecked(self, frame: np.ndarray):
+        """
+        Put a new frame into the buffer without validation (trusted decoder path).
         Immediately overwrites the previous frame (Strict Latest Frame Policy).
         Zero-copy: stores reference to frame data.
-        Atomic swap: minimal lock contention to prevent GUI starvation.
+        Lock-free: writes the inactive slot, then publishes it with a single index store.
         
         Args:
-            frame: NumPy array in RGB24 format from PyAV
+            frame: NumPy array from PyAV (Config.DISPLAY_PIXEL_FORMAT)
         """
-        # Atomic swap: minimal lock duration
-        with self.frame_lock:
-            self.current_frame = frame
-            self.last_frame_time = time.time()
+        inactive = 1 - self._active
+        self._slots[inactive] = frame
+        self._active = inactive  # Publish
+        self.last_frame_time_ns = _monotonic_ns()
         
-        # Notify outside lock to prevent callback blocking frame delivery
-        if self.on_frame_ready:
-            try:
-                self.on_frame_ready()
-            except Exception as e:
-                self.logger.log_error("CALLBACK_ERROR", f"Frame ready callback error: {e}")
+        # Notify consumers of the new frame, unless a notification is still pending;
+        # its take_frame() will pick up this newer frame instead
+        if self._notify_pending:
+            self.frames_dropped += 1
+        else:
+            self._notify_pending = True
+            self.signals.frame_ready.emit()
 
     def get_frame(self) -> Optional[np.ndarray]:
         """
         Get the current frame from the buffer (zero-copy).
         Returns direct reference to frame data without copying.
+        Lock-free peek: does not consume the frame or block the producer.
+        
+        Returns:
+            NumPy array or None if no frame available
+        """
+        return self._slots[self._active]
+
+    def take_frame(self) -> Optional[np.ndarray]:
+        """
+        Get the current frame in response to frame_ready (zero-copy).
+        Like get_frame(), but also re-arms frame_ready so the next published
+        frame sends a new notification.
         
         Returns:
             NumPy array or None if no frame available
         """
-        with self.frame_lock:
-            if self.current_frame is not None:
-                return self.current_frame
-        return None
+        # Clear before reading: a frame published after this point notifies again
+        self._notify_pending = False
+        return self._slots[self._active]
+
+    @property
+    def current_frame(self) -> Optional[np.ndarray]:
+        """Most recently published frame (alias of get_frame())."""
+        return self._slots[self._active]
 
     def clear(self):
-        """Clear the buffer."""
-        with self.frame_lock:
-            self.current_frame = None
-        self.last_frame_time = time.time()
+        """
+        Clear the buffer.
+        Not synchronized with the producer: call it while no producer is running
+        (StreamController clears before starting and after stopping the engine).
+        A put_frame racing with clear() may leave its frame in the buffer.
+        """
+        self._slots[0] = None
+        self._slots[1] = None
+        self.last_frame_time_ns = time.monotonic_ns()
 
     def start_watchdog(self):
-        """Start the watchdog monitoring thread."""
-        if self.watchdog_running:
+        """Register this buffer with the shared GUI-thread watchdog."""
+        if self.watchdog_active:
             return
         
-        self.watchdog_running = True
-        self.watchdog_thread = threading.Thread(
-            target=self._watchdog_loop,
-            daemon=True,
-            name="FrameBufferWatchdog"
-        )
-        self.watchdog_thread.start()
+        self.last_frame_time_ns = time.monotonic_ns()
+        self.watchdog_active = True
+        _WatchdogScheduler.register(self)
         self.logger.log_ui_event("Watchdog started")
 
     def stop_watchdog(self):
-        """Stop the watchdog monitoring thread."""
-        self.watchdog_running = False
-        # If we're inside the watchdog thread itself, don't call join on it
-        if self.watchdog_thread and threading.current_thread() is not self.watchdog_thread:
-            self.watchdog_thread.join(timeout=1)
+        """Unregister this buffer from the shared watchdog."""
+        self.watchdog_active = False
+        _WatchdogScheduler.unregister(self)
         self.logger.log_ui_event("Watchdog stopped")
 
-    def _watchdog_loop(self):
+    def _check_timeout(self, now_ns: int, timeout_ns: int):
         """
-        Watchdog loop - monitors frame arrival with 2.5s timeout.
-        Checks every 100ms for frame timeout.
-        Triggers reconnection if no frames received.
+        Watchdog check - called by the shared scheduler when a deadline is due.
+        Triggers reconnection if no frames received within the timeout.
         """
-        while self.watchdog_running:
-            time.sleep(Config.WATCHDOG_CHECK_INTERVAL)
+        elapsed_ns = now_ns - self.last_frame_time_ns
+        
+        # Timeout threshold: 2.5 seconds
+        if elapsed_ns >= timeout_ns:
+            self.logger.log_timeout(Config.WATCHDOG_TIMEOUT)
             
-            elapsed = time.time() - self.last_frame_time
+            # Reset timer first to avoid repeated timeout triggers
+            self.last_frame_time_ns = time.monotonic_ns()
             
-            # Timeout threshold: 2.5 seconds
-            if elapsed > Config.WATCHDOG_TIMEOUT:
-                self.logger.log_timeout(Config.WATCHDOG_TIMEOUT)
-                
-                if self.on_timeout:
-                    try:
-                        self.on_timeout()
-                    except Exception as e:
-                        self.logger.log_error("TIMEOUT_CALLBACK_ERROR", f"Timeout callback error: {e}")
-                
-                # Reset timer to avoid repeated timeout triggers
-                self.last_frame_time = time.time()
+            self.signals.timeout.emit()
 
     def reset_frame_timer(self):
         """Reset the frame timer (called when stream reconnects)."""
-        self.last_frame_time = time.time()
+        self.last_frame_time_ns = time.monotonic_ns()
 
     def get_buffer_stats(self) -> dict:
-        """Get buffer statistics."""
-        with self.frame_lock:
-            has_frame = self.current_frame is not None
-            frame_size = self.current_frame.nbytes if has_frame else 0
+        """
+        Get buffer statistics without blocking the producer.
+        Values may lag a concurrent publish by one frame, which is fine for stats.
+        """
+        frame = self._slots[self._active]  # Single read of the published frame
+        has_frame = frame is not None
+        frame_size = frame.nbytes if has_frame else 0
         
         return {
             "has_frame": has_frame,
             "frame_size_bytes": frame_size,
-            "time_since_last_frame": time.time() - self.last_frame_time,
+            "time_since_last_frame": (time.monotonic_ns() - self.last_frame_time_ns) / 1e9,
+            "frames_dropped": self.frames_dropped,
         }
+
+
+class _WatchdogScheduler:
+    """
+    Process-wide watchdog driven by a single QTimer on the GUI thread.
+    The timer is armed for the earliest frame deadline across all registered
+    FrameBuffers rather than polling, so while frames flow it wakes about once
+    per WATCHDOG_TIMEOUT instead of every check interval. Timeouts fire on the
+    GUI thread.
+    """
+
+    _timer: Optional[QTimer] = None
+    _buffers: List["weakref.ref[FrameBuffer]"] = []
+
+    @classmethod
+    def register(cls, buffer: FrameBuffer):
+        """Start watching a buffer (arms the shared timer)."""
+        cls._buffers.append(weakref.ref(buffer))
+        
+        if cls._timer is None:
+            cls._timer = QTimer()
+            cls._timer.setSingleShot(True)
+            cls._timer.timeout.connect(cls._on_tick)
+        cls._reschedule()
+
+    @classmethod
+    def unregister(cls, buffer: FrameBuffer):
+        """Stop watching a buffer (stops the shared timer when none remain)."""
+        cls._buffers = [ref for ref in cls._buffers if ref() not in (None, buffer)]
+        if not cls._buffers and cls._timer is not None:
+            cls._timer.stop()
+
+    @classmethod
+    def _reschedule(cls):
+        """Arm the timer for the earliest deadline of all watched buffers."""
+        timeout_ns = _WATCHDOG_TIMEOUT_NS
+        deadlines = [
+            buffer.last_frame_time_ns + timeout_ns
+            for buffer in (ref() for ref in cls._buffers)
+            if buffer is not None and buffer.watchdog_active
+        ]
+        if not deadlines:
+            cls._timer.stop()
+            return
+        
+        remaining_ms = -(-(min(deadlines) - time.monotonic_ns()) // 1_000_000)  # Round up
+        # Never re-arm sooner than the check interval to coalesce wakeups
+        cls._timer.start(max(remaining_ms, _WATCHDOG_MIN_INTERVAL_MS))
+
+    @classmethod
+    def _on_tick(cls):
+        """Check every live buffer for a frame timeout, then re-arm for the next deadline."""
+        now_ns = time.monotonic_ns()
+        timeout_ns = _WATCHDOG_TIMEOUT_NS
+        
+        # Iterate over a snapshot: timeout handlers may (un)register buffers
+        for ref in list(cls._buffers):
+            buffer = ref()
+            if buffer is not None and buffer.watchdog_active:
+                buffer._check_timeout(now_ns, timeout_ns)
+        
+        cls._buffers = [ref for ref in cls._buffers if ref() is not None]
+        cls._reschedule()
@@ -4,12 +4,17 @@ Reconnection Manager - Handles automatic reconnection with exponential backoff.
 
 import threading
 import time
+import weakref
 from enum import Enum
-from typing import Callable, Optional
+from typing import Callable
 from utils.logger import get_logger
 from utils.config import Config
 
 
+def _noop(*args):
+    """Default callback - lets callers invoke callbacks without a None check."""
+
+
 class StreamState(Enum):
     """Stream connection states."""
     IDLE = "idle"
@@ -24,9 +29,27 @@ class ReconnectionManager:
     Manages automatic reconnection with exponential backoff.
     Implements state machine for stream lifecycle.
     Uses interruptible wait to allow immediate stop during reconnection delays.
+    Managers that block in connection_failed() (wait_for_delay=True) share a
+    process-wide shutdown (see shutdown_all()); non-blocking managers never wait.
     """
 
-    def __init__(self):
+    # Process-wide shutdown: once set, reconnection delays are skipped
+    _shutdown_event = threading.Event()
+    _instances: "weakref.WeakSet[ReconnectionManager]" = weakref.WeakSet()
+
+    __slots__ = (
+        "logger", "state", "attempt_count", "state_lock", "wait_event", "wait_for_delay",
+        "on_state_changed", "on_reconnect_attempt", "on_max_retries_exceeded",
+        "__weakref__",
+    )
+
+    def __init__(self, wait_for_delay: bool = True):
+        """
+        Args:
+            wait_for_delay: Block in connection_failed() for the reconnection delay.
+                Set False when the caller schedules the retry itself (e.g. with a
+                GUI timer) so the calling thread is never blocked.
+        """
         self.logger = get_logger()
         self.state = StreamState.IDLE
         self.attempt_count = 0
@@ -35,16 +58,38 @@ class ReconnectionManager:
         # Interruptible wait event for reconnection delays
         self.wait_event = threading.Event()
         self.wait_event.set()  # Initially not waiting
+        self.wait_for_delay = wait_for_delay
+        
+        # Callbacks (no-op by default, so they are always safe to call)
+        self.on_state_changed: Callable[[StreamState], None] = _noop
+        self.on_reconnect_attempt: Callable[[int, int], None] = _noop
+        self.on_max_retries_exceeded: Callable[[], None] = _noop
         
-        # Callbacks
-        self.on_state_changed: Optional[Callable[[StreamState], None]] = None
-        self.on_reconnect_attempt: Optional[Callable[[int, int], None]] = None
-        self.on_max_retries_exceeded: Optional[Callable[[], None]] = None
+        ReconnectionManager._instances.add(self)
     
     def interrupt_wait(self):
         """Interrupt any ongoing wait during reconnection delay."""
         self.wait_event.set()
 
+    @classmethod
+    def shutdown_all(cls):
+        """
+        Process-wide shutdown: interrupt every blocking manager's reconnection
+        wait and skip delays from now on. Only needed when a manager runs with
+        wait_for_delay=True; StreamController schedules retries on a QTimer.
+        """
+        cls._shutdown_event.set()
+        for manager in list(cls._instances):
+            manager.interrupt_wait()
+
+    @classmethod
+    def reset_shutdown(cls):
+        """
+        Clear the process-wide shutdown flag so reconnection delays apply again
+        (for a fresh application run in the same process, e.g. tests).
+        """
+        cls._shutdown_event.clear()
+
     def get_state(self) -> StreamState:
         """Get current stream state."""
         with self.state_lock:
@@ -60,8 +105,7 @@ class ReconnectionManager:
         with self.state_lock:
             if self.state != new_state:
                 self.state = new_state
-                if self.on_state_changed:
-                    self.on_state_changed(new_state)
+                self.on_state_changed(new_state)
 
     def start_connection(self):
         """Start connection attempt."""
@@ -83,32 +127,38 @@ class ReconnectionManager:
         Args:
             error: Error message
         """
-        self.attempt_count += 1
+        max_attempts = Config.MAX_RECONNECTION_ATTEMPTS
+        delays = Config.RECONNECTION_DELAYS
+        
+        # Increment atomically and work from the local copy from here on
+        with self.state_lock:
+            attempt = self.attempt_count + 1
+            self.attempt_count = attempt
         
-        if self.attempt_count >= Config.MAX_RECONNECTION_ATTEMPTS:
+        if attempt >= max_attempts:
             self.set_state(StreamState.ERROR)
             self.logger.log_error(
                 "MAX_RETRIES",
-                f"Maximum reconnection attempts ({Config.MAX_RECONNECTION_ATTEMPTS}) exceeded",
+                f"Maximum reconnection attempts ({max_attempts}) exceeded",
                 "ERR_MAX_RETRIES"
             )
-            if self.on_max_retries_exceeded:
-                self.on_max_retries_exceeded()
+            self.on_max_retries_exceeded()
             return
         
         # Calculate wait time
-        wait_time = Config.RECONNECTION_DELAYS[self.attempt_count - 1]
+        wait_time = delays[attempt - 1]
         
         self.set_state(StreamState.RETRY)
-        self.logger.log_reconnect_attempt(self.attempt_count, wait_time)
+        self.logger.log_reconnect_attempt(attempt, wait_time)
         
-        if self.on_reconnect_attempt:
-            self.on_reconnect_attempt(self.attempt_count, wait_time)
+        self.on_reconnect_attempt(attempt, wait_time)
         
-        # Interruptible wait before retry (can be interrupted by user stop)
-        if wait_time > 0:
+        # Interruptible wait before retry (can be interrupted by user stop or shutdown)
+        if self.wait_for_delay and wait_time > 0 and not self._shutdown_event.is_set():
             self.wait_event.clear()
-            self.wait_event.wait(timeout=wait_time)
+            # shutdown_all() may have set wait_event just before the clear above
+            if not self._shutdown_event.is_set():
+                self.wait_event.wait(timeout=wait_time)
         
         # Transition to connecting
         self.set_state(StreamState.CONNECTING)
@@ -3,6 +3,11 @@ RTSP Stream Engine - Handles video decoding and frame processing using PyAV/FFmp
 """
 import av
 import av.error
+from av.video.reformatter import VideoReformatter
+import ctypes
+import os
+import queue
+import sys
 import threading
 import time
 from typing import Optional, Callable, Any
@@ -10,9 +15,40 @@ import numpy as np
 from PySide6.QtCore import QObject, Signal
 from utils.logger import get_logger
 from utils.config import Config
+from utils import stream_kind
 
 logger = get_logger()
 
+# av.open options and codec lookup built once at import rather than on every start()
+_RTSP_OPTIONS = {
+    **Config.FFMPEG_OPTIONS,
+    'stimeout': '5000000',
+    'buffer_size': '2048000',
+}
+_WEBCAM_OPTIONS = {'framerate': '30'}  # Request 30 FPS from camera
+_SUPPORTED_CODECS = frozenset(codec.lower() for codec in Config.SUPPORTED_CODECS)
+# Hardware decoders this FFmpeg build actually provides, probed once per codec
+_HW_DECODERS = {
+    codec: tuple(name for name in names if name in av.codecs_available)
+    for codec, names in Config.HW_DECODERS.items()
+}
+
+def _raise_thread_priority():
+    """
+    Raise the calling thread's scheduling priority, so decode is scheduled
+    promptly when a packet arrives. Best effort: silently keeps the default
+    priority when the OS refuses (e.g. no CAP_SYS_NICE on Linux).
+    """
+    try:
+        if sys.platform == "win32":
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), 1)  # THREAD_PRIORITY_ABOVE_NORMAL
+        elif sys.platform.startswith("linux"):
+            # On Linux the nice value is per thread, addressed by its native id
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), -5)
+    except (OSError, AttributeError):
+        pass
+
 class RTSPStreamEngine(QObject):
     """
     RTSP Stream Engine for handling video decoding and frame processing.
@@ -21,7 +57,7 @@ class RTSPStreamEngine(QObject):
     """
     
     # Qt Signals for GUI communication
-    frame_ready = Signal(np.ndarray)  # Emitted when new frame is ready
+    frame_ready = Signal(np.ndarray)  # Emitted when new frame is ready (Config.DISPLAY_PIXEL_FORMAT)
     fps_updated = Signal(float)       # Emitted with FPS updates
     error_occurred = Signal(str)      # Emitted on error
     connection_established = Signal(dict)  # Emitted on successful connection
@@ -39,27 +75,41 @@ class RTSPStreamEngine(QObject):
         self.stream = None
         self.is_running = False
         self.capture_thread = None
-        self.frame_callbacks = []
-        self.fps_callbacks = []  # Callbacks for FPS updates
+        # Decoded frames waiting for RGB conversion; converted on a separate thread
+        self.convert_thread = None
+        self.fps_thread = None
+        self._convert_queue: Optional[queue.Queue] = None
+        # Serializes _put_latest: stop() posts the stop sentinel while capture may still be producing
+        self._put_lock = threading.Lock()
+        # Callback tuples are replaced (never mutated) so the capture thread can iterate them safely
+        self.frame_callbacks = ()  # (callback, pixel_format) pairs
+        self.fps_callbacks = ()  # Callbacks for FPS updates
         self.fps = 30
         self.frame_count = 0
-        self.last_frame_time = time.time()
         self.codec_name = None
         self.width = None
         self.height = None
         self.connection_timeout = Config.RTSP_TIMEOUT
+        # Local files are decoded faster than real time and must be paced; live sources are not
+        self._is_file = False
+        # Hardware decoder context, used instead of the stream's own decoder when set
+        self._hw_codec_context = None
         self.interrupt_event = threading.Event()  # For graceful interruption
         # Thread that handles the (potentially slow) initial connection so the GUI stays responsive
         self._connect_thread: Optional[threading.Thread] = None
         
-    def add_frame_callback(self, callback: Callable[[np.ndarray], Any]):
+    def add_frame_callback(self, callback: Callable[[np.ndarray], Any],
+                           pixel_format: str = Config.TARGET_PIXEL_FORMAT):
         """
         Add a callback function to be called for each frame.
+        Each pixel format is converted at most once per frame and shared between
+        callbacks, so luma-only consumers can ask for "gray" and skip the RGB conversion.
         
         Args:
             callback: Function that takes a frame (numpy array) as input
+            pixel_format: PyAV to_ndarray format the callback expects (e.g. "rgb24", "gray")
         """
-        self.frame_callbacks.append(callback)
+        self.frame_callbacks = self.frame_callbacks + ((callback, pixel_format),)
     
     def add_fps_callback(self, callback: Callable[[float], Any]):
         """
@@ -68,7 +118,7 @@ class RTSPStreamEngine(QObject):
         Args:
             callback: Function that takes FPS (float) as input
         """
-        self.fps_callbacks.append(callback)
+        self.fps_callbacks = self.fps_callbacks + (callback,)
         
     def remove_frame_callback(self, callback: Callable[[np.ndarray], Any]):
         """
@@ -77,8 +127,10 @@ class RTSPStreamEngine(QObject):
         Args:
             callback: The callback function to remove
         """
-        if callback in self.frame_callbacks:
-            self.frame_callbacks.remove(callback)
+        for i, (registered, _) in enumerate(self.frame_callbacks):
+            if registered == callback:
+                self.frame_callbacks = self.frame_callbacks[:i] + self.frame_callbacks[i + 1:]
+                break
     
     def remove_fps_callback(self, callback: Callable[[float], Any]):
         """
@@ -88,7 +140,9 @@ class RTSPStreamEngine(QObject):
             callback: The callback function to remove
         """
         if callback in self.fps_callbacks:
-            self.fps_callbacks.remove(callback)
+            callbacks = list(self.fps_callbacks)
+            callbacks.remove(callback)
+            self.fps_callbacks = tuple(callbacks)
     def start(self) -> bool:
         """
         Start the RTSP stream or Local Webcam capture.
@@ -111,9 +165,8 @@ class RTSPStreamEngine(QObject):
             """
             try:
                 # Check if this is a local webcam (starts with video= or is just a number)
-                is_webcam = "video=" in self.rtsp_url or self.rtsp_url.isdigit()
-
-                options = Config.FFMPEG_OPTIONS.copy()
+                is_webcam = stream_kind.is_webcam(self.rtsp_url)
+                self._is_file = not is_webcam and os.path.isfile(self.rtsp_url)
 
                 if is_webcam:
                     # Specific settings for Windows webcam
@@ -121,19 +174,13 @@ class RTSPStreamEngine(QObject):
                     self.container = av.open(
                         self.rtsp_url,
                         format='dshow',  # Required for Windows cameras
-                        options={'framerate': '30'}  # Request 30 FPS from camera
+                        options=_WEBCAM_OPTIONS
                     )
                 else:
                     # Regular RTSP settings
-                    options.update({
-                        'rtsp_transport': 'tcp',
-                        'stimeout': '5000000',
-                        'allowed_media_types': 'video',
-                        'buffer_size': '2048000',
-                    })
                     self.container = av.open(
                         self.rtsp_url,
-                        options=options,
+                        options=_RTSP_OPTIONS,
                         timeout=self.connection_timeout
                     )
 
@@ -143,6 +190,11 @@ class RTSPStreamEngine(QObject):
 
                 self.stream = self.container.streams.video[0]
 
+                # Files can afford frame threading's extra frames of decode latency;
+                # live sources keep FFmpeg's default slice threading
+                if self._is_file:
+                    self.stream.codec_context.thread_type = "AUTO"
+
                 # Get codec information
                 self.codec_name = self.stream.codec_context.name
                 self.width = self.stream.width
@@ -166,15 +218,27 @@ class RTSPStreamEngine(QObject):
                 })
 
                 # For webcam testing, skip codec support check as it varies between cameras
-                if not is_webcam and self.codec_name.lower() not in Config.SUPPORTED_CODECS:
+                if not is_webcam and self.codec_name.lower() not in _SUPPORTED_CODECS:
                     logger.log_codec_error(self.codec_name)
                     self.error_occurred.emit(f"Unsupported codec: {self.codec_name}")
                     # Stop gracefully to clean up resources
                     self.stop()
                     return
 
+                if Config.VIDEO_DECODER or (Config.USE_HW_DECODE and not is_webcam):
+                    self._hw_codec_context = self._open_hw_decoder()
+
                 self.frame_count = 0
-                self.last_frame_time = time.time()
+
+                # Start the conversion thread first so it is ready for the first frame
+                self._convert_queue = queue.Queue(maxsize=Config.FRAME_BUFFER_SIZE)
+                self.convert_thread = threading.Thread(
+                    target=self._convert_frames,
+                    args=(self._convert_queue,),
+                    daemon=True,
+                    name="RTSPFrameConvert"
+                )
+                self.convert_thread.start()
 
                 # Start the loop that reads frames in a separate thread
                 self.capture_thread = threading.Thread(
@@ -184,6 +248,14 @@ class RTSPStreamEngine(QObject):
                 )
                 self.capture_thread.start()
 
+                # Sample FPS on a fixed schedule, off the decode path
+                self.fps_thread = threading.Thread(
+                    target=self._sample_fps,
+                    daemon=True,
+                    name="RTSPFpsSampler"
+                )
+                self.fps_thread.start()
+
             except Exception as e:
                 # Connection error - notify GUI and clean up state
                 error_msg = str(e)
@@ -191,7 +263,7 @@ class RTSPStreamEngine(QObject):
                 # Provide user-friendly error messages
                 if "Invalid data found" in error_msg:
                     user_msg = "The stream source returned invalid data. Please check the URL or try a different stream."
-                elif "I/O error" in error_msg and "video=" in self.rtsp_url:
+                elif "I/O error" in error_msg and stream_kind.is_webcam(self.rtsp_url):
                     # Webcam error - try to provide helpful suggestions
                     from utils.webcam_utils import get_available_webcams
                     available = get_available_webcams()
@@ -232,6 +304,17 @@ class RTSPStreamEngine(QObject):
         if self.capture_thread and self.capture_thread.is_alive():
             self.capture_thread.join(timeout=1.0)
         
+        # Always wake the conversion thread: capture may still be blocked in demux
+        # (stalled socket) and would only send its own sentinel once it returns
+        if self._convert_queue is not None:
+            self._put_latest(self._convert_queue, None)
+        
+        if self.convert_thread and self.convert_thread.is_alive():
+            self.convert_thread.join(timeout=1.0)
+        
+        if self.fps_thread and self.fps_thread.is_alive():
+            self.fps_thread.join(timeout=1.0)
+        
         if self.container:
             try:
                 self.container.close()
@@ -241,61 +324,220 @@ class RTSPStreamEngine(QObject):
                 self.container = None
         
         self.stream = None
+        self._hw_codec_context = None
         logger.log_disconnection("Stream stopped")
     
+    def _open_hw_decoder(self) -> Optional[av.CodecContext]:
+        """
+        Create a hardware decoder context for the current stream: the
+        Config.VIDEO_DECODER override if set, otherwise each decoder from
+        Config.HW_DECODERS that this FFmpeg build provides, in order.
+        
+        Returns:
+            Decoder context, or None if no suitable decoder can be opened
+            on this machine
+        """
+        if Config.VIDEO_DECODER:
+            candidates = (Config.VIDEO_DECODER,)
+        else:
+            candidates = _HW_DECODERS.get(self.codec_name, ())
+        
+        stream_codec_id = self.stream.codec_context.codec.id
+        for hw_name in candidates:
+            try:
+                ctx = av.CodecContext.create(hw_name, "r")
+                if ctx.codec.id != stream_codec_id:
+                    logger.log_error("HW_DECODE_UNAVAILABLE", f"{hw_name} cannot decode {self.codec_name} streams")
+                    continue
+                ctx.extradata = self.stream.codec_context.extradata
+                ctx.open()
+            except (ValueError, av.error.FFmpegError) as e:
+                logger.log_error("HW_DECODE_UNAVAILABLE", f"{hw_name} could not be opened: {e}")
+                continue
+            
+            logger.log_ui_event(f"Using decoder: {hw_name}")
+            return ctx
+        
+        logger.log_ui_event(
+            f"No usable decoder override or hardware decoder for {self.codec_name}, "
+            "using software decode"
+        )
+        return None
+    
+    def _decode_packets(self, ctx: av.CodecContext):
+        """
+        Demux packets from the container and decode them with the given decoder.
+        Same loop as container.decode(), but with the codec context chosen by the caller.
+        
+        Args:
+            ctx: Hardware decoder context, or the stream's own codec context
+            
+        Yields:
+            Decoded video frames
+        """
+        for packet in self.container.demux(self.stream):
+            for frame in ctx.decode(packet):
+                yield frame
+    
     def _capture_frames(self):
         """
         Internal method to capture and decode frames in a separate thread.
-        Converts frames to RGB24 NumPy arrays with zero-copy techniques.
-        Sends FPS updates via callbacks and signals, handles graceful interruption.
+        Hands decoded frames to the conversion thread, replacing any frame it
+        has not picked up yet (Latest Frame Policy), so a slow conversion or
+        consumer never delays decoding.
+        Only counts frames for FPS (see _sample_fps), handles graceful interruption.
+        Frames are still counted when nothing consumes them, but not converted.
         """
+        if Config.RAISE_CAPTURE_PRIORITY:
+            _raise_thread_priority()
+        
+        meta = self.metaObject()
+        frame_ready_method = meta.method(meta.indexOfSignal("frame_ready(PyObject)"))
+        convert_queue = self._convert_queue
+        
+        # Local files are paced against absolute deadlines so sleep overshoot never accumulates
+        pace = self._is_file
+        frame_interval = 1.0 / self.fps
+        next_deadline = time.monotonic()
+        
         while self.is_running and self.container:
             try:
-                for frame in self.container.decode(self.stream):
+                ctx = self._hw_codec_context
+                if ctx is None:
+                    ctx = self.stream.codec_context
+                for frame in self._decode_packets(ctx):
                     if not self.is_running or self.interrupt_event.is_set():
                         break
                     
-                    # Convert frame to RGB24 NumPy array (zero-copy)
-                    rgb_frame = frame.to_ndarray(format=Config.TARGET_PIXEL_FORMAT)
+                    if pace:
+                        delay = next_deadline - time.monotonic()
+                        if delay > 0:
+                            if self.interrupt_event.wait(delay):
+                                break
+                        else:
+                            # Fell behind: restart the schedule instead of bursting to catch up
+                            next_deadline = time.monotonic()
+                        next_deadline += frame_interval
                     
                     self.frame_count += 1
-                    current_time = time.time()
-                    
-                    # Emit frame ready signal to GUI
-                    self.frame_ready.emit(rgb_frame)
                     
-                    # Call frame callbacks
-                    for callback in self.frame_callbacks:
-                        try:
-                            callback(rgb_frame)
-                        except Exception as e:
-                            logger.log_error("CALLBACK_ERROR", f"Error in frame callback: {e}")
-                    
-                    # Calculate actual FPS every 30 frames and notify via callback and signal
-                    if self.frame_count % 30 == 0:
-                        elapsed = current_time - self.last_frame_time
-                        actual_fps = 30 / elapsed if elapsed > 0 else 0
-                        logger.log_ui_event(f"Actual FPS: {actual_fps:.2f}")
-                        
-                        # Emit FPS signal to GUI
-                        self.fps_updated.emit(actual_fps)
-                        
-                        # Notify FPS callbacks (for non-GUI use)
-                        for callback in self.fps_callbacks:
-                            try:
-                                callback(actual_fps)
-                            except Exception as e:
-                                logger.log_error("FPS_CALLBACK_ERROR", f"Error in FPS callback: {e}")
-                        
-                        self.last_frame_time = current_time
+                    # Only pay for the RGB conversion when someone consumes the frame
+                    if self.frame_callbacks or self.isSignalConnected(frame_ready_method):
+                        self._put_latest(convert_queue, frame)
                             
             except Exception as e:
                 logger.log_error("DECODE_ERROR", f"Error decoding frame: {e}", "ERR_DECODE")
                 self.error_occurred.emit(f"Decode error: {str(e)}")
                 break
         
+        # Wake the conversion thread so it exits with this one
+        self._put_latest(convert_queue, None)
         logger.log_ui_event("Frame capture thread ended")
     
+    def _sample_fps(self):
+        """
+        Internal method that samples the frame counter every Config.FPS_UPDATE_INTERVAL
+        and reports actual FPS via the fps_updated signal and FPS callbacks.
+        Reports 0 during stalls instead of holding the last value.
+        Runs until the stream is stopped or the capture thread ends.
+        """
+        interval = Config.FPS_UPDATE_INTERVAL / 1000
+        last_count = self.frame_count
+        last_time_ns = time.monotonic_ns()
+        
+        while not self.interrupt_event.wait(interval):
+            capture_thread = self.capture_thread
+            if not self.is_running or capture_thread is None or not capture_thread.is_alive():
+                break
+            
+            count = self.frame_count
+            current_time_ns = time.monotonic_ns()
+            elapsed_ns = current_time_ns - last_time_ns
+            actual_fps = (count - last_count) * 1e9 / elapsed_ns if elapsed_ns > 0 else 0
+            last_count = count
+            last_time_ns = current_time_ns
+            logger.log_ui_event(f"Actual FPS: {actual_fps:.2f}")
+            
+            # Emit FPS signal to GUI
+            self.fps_updated.emit(actual_fps)
+            
+            # Notify FPS callbacks (for non-GUI use)
+            for callback in self.fps_callbacks:
+                try:
+                    callback(actual_fps)
+                except Exception as e:
+                    logger.log_error("FPS_CALLBACK_ERROR", f"Error in FPS callback: {e}")
+    
+    def _put_latest(self, frame_queue: queue.Queue, item):
+        """
+        Put an item into a bounded queue, discarding the oldest entry if it is full.
+        Safe to call from the capture thread and stop() concurrently.
+        
+        Args:
+            frame_queue: Queue shared with the conversion thread
+            item: Decoded frame, or None to stop the conversion thread
+        """
+        with self._put_lock:
+            try:
+                frame_queue.put_nowait(item)
+            except queue.Full:
+                try:
+                    frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                frame_queue.put_nowait(item)
+    
+    def _convert_frames(self, frame_queue: queue.Queue):
+        """
+        Internal method that converts decoded frames to NumPy arrays in a separate
+        thread and delivers them via the frame_ready signal (Config.DISPLAY_PIXEL_FORMAT) and callbacks
+        (in the format each one registered with).
+        Runs until the capture thread sends None or the stream is interrupted.
+        
+        Args:
+            frame_queue: Queue fed by the capture thread
+        """
+        meta = self.metaObject()
+        frame_ready_method = meta.method(meta.indexOfSignal("frame_ready(PyObject)"))
+        display_format = Config.DISPLAY_PIXEL_FORMAT
+        # One resident swscale context per output format for the whole stream
+        # (frame.to_ndarray(format=...) builds a new reformatter on every call)
+        reformatters = {}
+        
+        def to_ndarray(frame, pixel_format: str) -> np.ndarray:
+            reformatter = reformatters.get(pixel_format)
+            if reformatter is None:
+                reformatter = reformatters[pixel_format] = VideoReformatter()
+            return reformatter.reformat(frame, format=pixel_format).to_ndarray()
+        
+        while True:
+            # Blocks until the next frame; capture (on exit) and stop() both send None
+            frame = frame_queue.get()
+            if frame is None or self.interrupt_event.is_set():
+                break
+            
+            # Arrays already converted for this frame, keyed by pixel format
+            converted = {}
+            
+            if self.isSignalConnected(frame_ready_method):
+                # Convert frame to the display format (zero-copy)
+                display_frame = converted[display_format] = to_ndarray(frame, display_format)
+                
+                # Emit frame ready signal to GUI
+                self.frame_ready.emit(display_frame)
+            
+            # Call frame callbacks
+            for callback, pixel_format in self.frame_callbacks:
+                try:
+                    array = converted.get(pixel_format)
+                    if array is None:
+                        array = converted[pixel_format] = to_ndarray(frame, pixel_format)
+                    callback(array)
+                except Exception as e:
+                    logger.log_error("CALLBACK_ERROR", f"Error in frame callback: {e}")
+        
+        logger.log_ui_event("Frame conversion thread ended")
+    
     def get_frame(self, timeout: float = 1.0) -> Optional[np.ndarray]:
         """
         Get a frame from the stream (deprecated - use frame callbacks instead).
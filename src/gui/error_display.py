@@ -4,12 +4,34 @@ Error Display - Handles error message presentation to user.
 
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtGui import QFont, QColor, QPalette
+
+# Header text colors by error type. Applied through the palette rather than
+# per-label stylesheets, so the dialog never goes through Qt's CSS engine
+_TYPE_COLORS = {
+    "Validation Error": QColor("#FF9800"),  # Orange
+    "Connection Error": QColor("#F44336"),  # Red
+    "Codec Error": QColor("#E91E63"),       # Pink
+}
+_DEFAULT_TYPE_COLOR = QColor("#2196F3")     # Blue
+_CODE_COLOR = QColor("#666666")
+
+
+def _set_text_color(label: QLabel, color: QColor):
+    """Set a label's text color via its palette."""
+    palette = label.palette()
+    palette.setColor(QPalette.WindowText, color)
+    label.setPalette(palette)
 
 
 class ErrorDialog(QDialog):
     """Dialog for displaying error messages."""
 
+    # Fonts shared by all dialogs, built by the first one (QFont needs a QApplication)
+    _type_font = None
+    _message_font = None
+    _code_font = None
+
     def __init__(self, parent=None, error_type: str = "Error", message: str = "", error_code: str = ""):
         super().__init__(parent)
         self.setWindowTitle(f"VisionStream - {error_type}")
@@ -19,34 +41,26 @@ class ErrorDialog(QDialog):
 
     def init_ui(self, error_type: str, message: str, error_code: str):
         """Initialize the error dialog UI."""
+        self._init_fonts()
         layout = QVBoxLayout()
 
         # Error type header
         type_label = QLabel(error_type)
-        type_font = QFont("Arial", 14)
-        type_font.setBold(True)
-        type_label.setFont(type_font)
+        type_label.setFont(self._type_font)
         
         # Color code by error type
-        if error_type == "Validation Error":
-            type_label.setStyleSheet("color: #FF9800;")  # Orange
-        elif error_type == "Connection Error":
-            type_label.setStyleSheet("color: #F44336;")  # Red
-        elif error_type == "Codec Error":
-            type_label.setStyleSheet("color: #E91E63;")  # Pink
-        else:
-            type_label.setStyleSheet("color: #2196F3;")  # Blue
+        _set_text_color(type_label, _TYPE_COLORS.get(error_type, _DEFAULT_TYPE_COLOR))
 
         # Error message
         message_label = QLabel(message)
         message_label.setWordWrap(True)
-        message_label.setFont(QFont("Arial", 11))
+        message_label.setFont(self._message_font)
 
         # Error code (if provided)
         if error_code:
             code_label = QLabel(f"Error Code: {error_code}")
-            code_label.setFont(QFont("Courier", 9))
-            code_label.setStyleSheet("color: #666666;")
+            code_label.setFont(self._code_font)
+            _set_text_color(code_label, _CODE_COLOR)
             layout.addWidget(code_label)
 
         # OK button
@@ -60,6 +74,17 @@ class ErrorDialog(QDialog):
 
         self.setLayout(layout)
 
+    @classmethod
+    def _init_fonts(cls):
+        """Create the shared dialog fonts on first use."""
+        if cls._type_font is not None:
+            return
+        type_font = QFont("Arial", 14)
+        type_font.setBold(True)
+        cls._type_font = type_font
+        cls._message_font = QFont("Arial", 11)
+        cls._code_font = QFont("Courier", 9)
+
     @staticmethod
     def show_validation_error(parent, message: str):
         """Show validation error dialog."""
@@ -3,22 +3,35 @@ Main Window - Primary UI component for VisionStream.
 """
 
 import os
-import re
+import stat
+import string
+from urllib.parse import urlsplit
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLineEdit, QPushButton, QLabel, QFileDialog
+    QLineEdit, QPushButton, QLabel, QFileDialog, QMessageBox, QInputDialog
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
 from .video_widget import VideoWidget
 from .error_display import ErrorDialog
 from utils.config import Config
+from utils.webcam_utils import get_available_webcams
+from utils import stream_kind
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
-    # RTSP URL validation regex pattern
-    RTSP_URL_PATTERN = re.compile(r'^rtsp://[a-zA-Z0-9\-._~:/?#\[\]@!$&\'()*+,;=]+$')
+    # Characters allowed in an RTSP URL (RFC 3986 unreserved + reserved)
+    RTSP_URL_CHARS = frozenset(string.ascii_letters + string.digits + "-._~:/?#[]@!$&'()*+,;=")
+
+    # Protocols rejected with a hint to use rtsp:// instead
+    UNSUPPORTED_PROTOCOLS = ('http://', 'https://', 'ftp://', 'file://')
+
+    # Accepted local video file extensions (lowercase), most common first
+    VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.mov', '.avi', '.m4v', '.flv', '.wmv', '.mpeg', '.mpg')
+
+    # Repeated Play/Stop clicks within this window (ms) are ignored
+    PLAY_CLICK_DEBOUNCE_MS = 250
     
     # Signals for stream control
     play_requested = Signal(str)  # Emitted when Play button clicked with URL
@@ -30,6 +43,14 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1280, 720)
         # Track current playback state to drive Play/Stop toggle
         self.is_playing = False
+        # Last values applied to the controls (match the initial UI built in init_ui)
+        self._last_play_text = "Play"
+        self._last_inputs_enabled = True
+        self._last_status = "Ready"
+        # Running while Play/Stop clicks are being ignored after an accepted click
+        self._play_click_guard = QTimer(self)
+        self._play_click_guard.setSingleShot(True)
+        self._play_click_guard.setInterval(self.PLAY_CLICK_DEBOUNCE_MS)
         self.init_ui()
 
     def init_ui(self):
@@ -60,7 +81,7 @@ class MainWindow(QMainWindow):
         self.list_webcams_button = QPushButton("List Cameras")
 
         # Connect button signals
-        self.play_button.clicked.connect(self._on_play_stop_clicked)
+        self.play_button.clicked.connect(self._on_play_button_clicked)
         self.open_file_button.clicked.connect(self._on_open_file_clicked)
         self.list_webcams_button.clicked.connect(self._on_list_webcams_clicked)
 
@@ -111,13 +132,17 @@ class MainWindow(QMainWindow):
         url = url.strip()
 
         # 1) Webcam device ("video=0" / "0") - check first
-        lower_url = url.lower()
-        if lower_url.startswith("video=") or lower_url.isdigit():
+        if stream_kind.is_webcam(url):
             return True
 
-        # 2) RTSP URL
-        if url.lower().startswith("rtsp://"):
-            if not self.RTSP_URL_PATTERN.match(url):
+        # 2) RTSP URL (scheme matched in any case so "RTSP://" gets the RTSP format error)
+        if url[:7].lower() == "rtsp://":
+            try:
+                has_host = bool(urlsplit(url).netloc)
+            except ValueError:
+                has_host = False
+            # FFmpeg matches protocols case-sensitively: "RTSP://" would fail to open
+            if not stream_kind.is_rtsp(url) or not has_host or not self.RTSP_URL_CHARS.issuperset(url):
                 ErrorDialog.show_validation_error(
                     self,
                     "Invalid RTSP URL format.\n\nExpected format: rtsp://host:port/path"
@@ -126,14 +151,14 @@ class MainWindow(QMainWindow):
             return True
 
         # 3) Check for unsupported protocols
-        unsupported_protocols = ['http://', 'https://', 'ftp://', 'file://']
-        for protocol in unsupported_protocols:
-            if url.lower().startswith(protocol):
-                ErrorDialog.show_validation_error(
-                    self,
-                    f"Unsupported protocol.\n\nOnly RTSP streams are supported. Use rtsp:// instead of {protocol}"
-                )
-                return False
+        lower_url = url.lower()
+        if lower_url.startswith(self.UNSUPPORTED_PROTOCOLS):
+            protocol = lower_url[:lower_url.index('://') + 3]
+            ErrorDialog.show_validation_error(
+                self,
+                f"Unsupported protocol.\n\nOnly RTSP streams are supported. Use rtsp:// instead of {protocol}"
+            )
+            return False
 
         # 4) Local file path - check if it looks like a path
         looks_like_path = ('/' in url or '\\' in url or ':' in url or '.' in url)
@@ -145,8 +170,10 @@ class MainWindow(QMainWindow):
             )
             return False
 
-        # Check if file exists
-        if not os.path.exists(url):
+        # Check if file exists (single stat call, also used for the file check)
+        try:
+            file_stat = os.stat(url)
+        except (OSError, ValueError):
             ErrorDialog.show_validation_error(
                 self,
                 f"File not found:\n\n{url}"
@@ -154,7 +181,7 @@ class MainWindow(QMainWindow):
             return False
 
         # Check if it's a file (not directory)
-        if not os.path.isfile(url):
+        if not stat.S_ISREG(file_stat.st_mode):
             ErrorDialog.show_validation_error(
                 self,
                 f"Path is not a file:\n\n{url}"
@@ -162,8 +189,7 @@ class MainWindow(QMainWindow):
             return False
 
         # Check file extension
-        video_extensions = ('.mp4', '.avi', '.mkv', '.mov', '.flv', '.wmv', '.m4v', '.mpg', '.mpeg')
-        if not url.lower().endswith(video_extensions):
+        if not lower_url.endswith(self.VIDEO_EXTENSIONS):
             ErrorDialog.show_validation_error(
                 self,
                 f"Unsupported file type.\n\nExpected video file (.mp4, .avi, .mkv, etc.)"
@@ -185,41 +211,72 @@ class MainWindow(QMainWindow):
         
         event.accept()
 
+    def _apply_controls(self, play_text: str, inputs_enabled: bool, status: str):
+        """
+        Apply control state, skipping widget writes whose value is unchanged.
+        Each write is a Qt call that can trigger a re-polish and repaint, so
+        when several widgets change, updates are disabled around the writes
+        and re-enabling schedules a single repaint.
+        
+        Args:
+            play_text: Text for the Play/Stop toggle button
+            inputs_enabled: Whether the URL field and source buttons are editable
+            status: Status bar text
+        """
+        play_changed = play_text != self._last_play_text
+        inputs_changed = inputs_enabled != self._last_inputs_enabled
+        status_changed = status != self._last_status
+        
+        # Widget writes needed: 1 for the button, 3 for the inputs, 1 for the status
+        writes = play_changed + 3 * inputs_changed + status_changed
+        if writes == 0:
+            return
+        
+        batch = writes > 1
+        if batch:
+            self.setUpdatesEnabled(False)
+        try:
+            if play_changed:
+                self.play_button.setText(play_text)
+                self._last_play_text = play_text
+            
+            if inputs_changed:
+                self.open_file_button.setEnabled(inputs_enabled)
+                self.list_webcams_button.setEnabled(inputs_enabled)
+                self.url_input.setReadOnly(not inputs_enabled)
+                self._last_inputs_enabled = inputs_enabled
+            
+            if status_changed:
+                self.status_label.setText(status)
+                self._last_status = status
+        finally:
+            if batch:
+                self.setUpdatesEnabled(True)
+
+    @Slot()
     def set_playing(self):
         """Update UI state to playing."""
         self.is_playing = True
-        self.play_button.setText("Stop")
-        self.play_button.setEnabled(True)
-        self.open_file_button.setEnabled(False)
-        self.list_webcams_button.setEnabled(False)
-        self.url_input.setReadOnly(True)
-        self.status_label.setText("Playing...")
+        self._apply_controls("Stop", False, "Playing...")
         self.video_widget.set_connecting(False)
 
+    @Slot()
     def set_stopped(self):
         """Update UI state to stopped."""
         self.is_playing = False
-        self.play_button.setText("Play")
-        self.play_button.setEnabled(True)
-        self.open_file_button.setEnabled(True)
-        self.list_webcams_button.setEnabled(True)
-        self.url_input.setReadOnly(False)
-        self.status_label.setText("Ready")
+        self._apply_controls("Play", True, "Ready")
         self.video_widget.clear_display()
         self.video_widget.set_connecting(False)
 
+    @Slot()
     def set_connecting(self):
         """Update UI state to connecting."""
         # During connecting, treat button as Stop (allow user to cancel)
         self.is_playing = True
-        self.play_button.setText("Stop")
-        self.play_button.setEnabled(True)
-        self.open_file_button.setEnabled(False)
-        self.list_webcams_button.setEnabled(False)
-        self.url_input.setReadOnly(True)
-        self.status_label.setText("Connecting...")
+        self._apply_controls("Stop", False, "Connecting...")
         self.video_widget.set_connecting(True)
 
+    @Slot(str)
     def set_error(self, error_message: str):
         """
         Update UI state to error.
@@ -228,15 +285,23 @@ class MainWindow(QMainWindow):
             error_message: Error message to display
         """
         self.is_playing = False
-        self.play_button.setText("Play")
-        self.play_button.setEnabled(True)
-        self.open_file_button.setEnabled(True)
-        self.list_webcams_button.setEnabled(True)
-        self.url_input.setReadOnly(False)
-        self.status_label.setText(f"Error: {error_message}")
+        self._apply_controls("Play", True, f"Error: {error_message}")
         self.video_widget.clear_display()
         self.video_widget.set_connecting(False)
 
+    @Slot()
+    def _on_play_button_clicked(self):
+        """
+        Handle a Play/Stop button click, ignoring repeats within
+        PLAY_CLICK_DEBOUNCE_MS so a double-click does not start and
+        immediately stop (or stop and restart) the stream.
+        """
+        if self._play_click_guard.isActive():
+            return
+        self._play_click_guard.start()
+        self._on_play_stop_clicked()
+
+    @Slot()
     def _on_play_stop_clicked(self):
         """Toggle between Play and Stop based on current state."""
         if self.is_playing:
@@ -248,6 +313,7 @@ class MainWindow(QMainWindow):
             if self.validate_url(url):
                 self.play_requested.emit(url)
 
+    @Slot()
     def _on_open_file_clicked(self):
         """Open a file dialog and put selected path into the URL field."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -262,11 +328,9 @@ class MainWindow(QMainWindow):
             if not self.is_playing:
                 self._on_play_stop_clicked()
 
+    @Slot()
     def _on_list_webcams_clicked(self):
         """List available webcams in a dialog."""
-        from utils.webcam_utils import get_available_webcams
-        from PySide6.QtWidgets import QMessageBox, QInputDialog
-        
         cameras = get_available_webcams()
         
         if not cameras:
@@ -4,17 +4,26 @@ Video Widget - Displays video frames with FPS counter and aspect ratio preservat
 
 from PySide6.QtWidgets import QLabel
 from PySide6.QtGui import QImage, QPixmap, QFont, QColor, QPainter
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QRect
 import numpy as np
+import time
 
 
 class VideoWidget(QLabel):
     """Custom widget for video frame rendering."""
 
+    # Connecting spinner animation frames
+    SPINNER_CHARS = ['⠋', '⠙', '⠹', '⠸']
+    
+    # Idle time (ms) after the last frame before it is repainted with smooth scaling
+    SMOOTH_AFTER_MS = 200
+
     def __init__(self):
         super().__init__()
         self.setAlignment(Qt.AlignCenter)
-        self.setStyleSheet("background-color: black;")
+        # paintEvent covers the whole widget (black background / letterbox bars),
+        # so Qt skips erasing the background before every frame
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
         self.setMinimumSize(640, 480)
         
         # FPS tracking
@@ -27,20 +36,60 @@ class VideoWidget(QLabel):
         # Stream info (resolution, codec)
         self.stream_info = {}
         
+        # Overlay fonts, built once instead of on every frame / spinner tick
+        self._info_font = QFont("Arial", 10)
+        self._info_font.setBold(True)
+        self._spinner_font = QFont("Arial", 48)
+        self._spinner_font.setBold(True)
+        self._connecting_font = QFont("Arial", 14)
+        self._connecting_font.setBold(True)
+        
+        # Current frame as a QImage sharing the memory of _frame_ref, which must
+        # stay alive while the image is shown
+        self._frame_image = None
+        self._frame_ref = None
+        
+        # True while a video frame (not the black screen or connecting overlay) is shown;
+        # frames and the FPS/info overlay are painted in paintEvent
+        self._showing_frame = False
+        
+        # Frames are scaled with fast nearest-neighbour unless smooth scaling is enabled.
+        # When no new frame arrives for SMOOTH_AFTER_MS (paused/stalled stream), the
+        # last frame is repainted smoothly once. The timer is armed once and re-checks
+        # the idle time when it fires, instead of being restarted on every frame
+        self.smooth_scaling = False
+        self._frame_settled = False
+        self._last_frame_ns = 0
+        self._frame_interval_ns = 0
+        self.smooth_timer = QTimer(self)
+        self.smooth_timer.setSingleShot(True)
+        self.smooth_timer.timeout.connect(self._on_frame_settled)
+        
         # Connection state
         self.is_connecting = False
         self.connecting_spinner_frame = 0
-        self.connecting_timer = QTimer()
+        # Rendered connecting overlays, one per spinner frame, for _overlay_cache_size
+        self._overlay_cache = [None] * len(self.SPINNER_CHARS)
+        self._overlay_cache_size = None
+        # Spinner timer only runs while connecting and shown (see _update_spinner_timer).
+        # _shown follows show/hide events, which unlike isVisible() also cover the
+        # spontaneous hide Qt sends when the window is minimized
+        self._shown = False
+        self.connecting_timer = QTimer(self)
+        self.connecting_timer.setInterval(100)  # Update spinner every 100ms
         self.connecting_timer.timeout.connect(self._update_spinner)
-        self.connecting_timer.start(100)  # Update spinner every 100ms
 
     def display_frame(self, frame_array: np.ndarray):
         """
         Display a frame from NumPy array with optimized scaling and aspect ratio.
-        Uses FastTransformation for performance during playback.
+        The frame is wrapped in a QImage without copying and drawn scaled straight
+        into its letterboxed rectangle by paintEvent, so no pixmap is uploaded or
+        scaled per frame; paintEvent also fills the letterbox bars.
         
         Args:
-            frame_array: NumPy array in RGB24 format
+            frame_array: NumPy array, 32-bit xRGB in native byte order
+                (Config.DISPLAY_PIXEL_FORMAT, displayed without pixel conversion)
+                or RGB24
         """
         if frame_array is None or frame_array.size == 0:
             return
@@ -48,44 +97,79 @@ class VideoWidget(QLabel):
         height, width = frame_array.shape[:2]
         
         # Convert NumPy array to QImage (zero-copy reference to frame data)
-        bytes_per_line = 3 * width
+        if frame_array.shape[2] == 4:
+            image_format = QImage.Format_RGB32
+        else:
+            image_format = QImage.Format_RGB888
         q_image = QImage(
             frame_array.data,
             width,
             height,
-            bytes_per_line,
-            QImage.Format_RGB888
+            frame_array.strides[0],
+            image_format
         )
 
-        # Convert to pixmap and scale with aspect ratio preservation
-        # Use FastTransformation for performance during playback
-        pixmap = QPixmap.fromImage(q_image)
-        scaled_pixmap = pixmap.scaled(
-            self.size(),
-            Qt.KeepAspectRatio,
-            Qt.FastTransformation  # Fast scaling for real-time performance
-        )
+        # Drop the black screen / connecting overlay pixmap when frames start
+        if not self._showing_frame:
+            self.clear()
+            self._showing_frame = True
         
-        # Create final pixmap with letterboxing (black bars)
-        final_pixmap = QPixmap(self.width(), self.height())
-        final_pixmap.fill(QColor("black"))
+        self._frame_image = q_image
+        self._frame_ref = frame_array
+        self._frame_settled = False
+        now_ns = time.monotonic_ns()
+        self._frame_interval_ns = now_ns - self._last_frame_ns
+        self._last_frame_ns = now_ns
+        if not self.smooth_timer.isActive():
+            self.smooth_timer.start(self.SMOOTH_AFTER_MS)
+        self.update()
+        self.frame_count += 1
+
+    def paintEvent(self, event):
+        """
+        Paint the black background and label contents (black screen / connecting
+        overlay), or the current frame with letterbox bars and FPS/info overlay.
+        The widget is opaque, so every pixel must be painted here.
         
-        # Center the scaled pixmap
-        x = (self.width() - scaled_pixmap.width()) // 2
-        y = (self.height() - scaled_pixmap.height()) // 2
+        Args:
+            event: Paint event
+        """
+        if not self._showing_frame:
+            painter = QPainter(self)
+            painter.fillRect(self.rect(), Qt.black)
+            painter.end()
+            super().paintEvent(event)
+            return
         
         # Draw frame and FPS counter with proper painter lifecycle management
-        painter = QPainter(final_pixmap)
+        painter = QPainter(self)
         try:
-            painter.drawPixmap(x, y, scaled_pixmap)
-            # Draw FPS counter
+            # Scale with aspect ratio preservation, centered (letterboxing)
+            painter.setRenderHint(
+                QPainter.SmoothPixmapTransform,
+                self.smooth_scaling or self._frame_settled
+            )
+            size = self.size()
+            width = size.width()
+            height = size.height()
+            target = self._frame_image.size().scaled(size, Qt.KeepAspectRatio)
+            target_width = target.width()
+            target_height = target.height()
+            x = (width - target_width) // 2
+            y = (height - target_height) // 2
+            
+            # Only the bars around the frame need filling
+            if x > 0:
+                painter.fillRect(0, 0, x, height, Qt.black)
+                painter.fillRect(x + target_width, 0, width - x - target_width, height, Qt.black)
+            if y > 0:
+                painter.fillRect(0, 0, width, y, Qt.black)
+                painter.fillRect(0, y + target_height, width, height - y - target_height, Qt.black)
+            
+            painter.drawImage(QRect(x, y, target_width, target_height), self._frame_image)
             self.draw_fps(painter)
         finally:
-            # Ensure painter is properly ended before NumPy buffer lifecycle changes
             painter.end()
-        
-        self.setPixmap(final_pixmap)
-        self.frame_count += 1
 
     def draw_fps(self, painter: QPainter):
         """
@@ -106,9 +190,7 @@ class VideoWidget(QLabel):
             if 'codec' in self.stream_info:
                 lines.append(f"Codec: {self.stream_info['codec'].upper()}")
         
-        font = QFont("Arial", 10)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setFont(self._info_font)
         
         # Calculate dimensions
         metrics = painter.fontMetrics()
@@ -140,13 +222,18 @@ class VideoWidget(QLabel):
         # Create black pixmap
         black_pixmap = QPixmap(self.width(), self.height())
         black_pixmap.fill(QColor("black"))
+        self._showing_frame = False
         self.setPixmap(black_pixmap)
+        self._frame_image = None
+        self._frame_ref = None
+        self.smooth_timer.stop()
         
         # Reset counters
         self.frame_count = 0
         self.fps = 0
         self.stream_info = {}
         self.is_connecting = False
+        self._update_spinner_timer()
 
     def set_stream_info(self, info: dict):
         """
@@ -157,6 +244,36 @@ class VideoWidget(QLabel):
         """
         self.stream_info = info
 
+    def set_smooth_scaling(self, enabled: bool):
+        """
+        Choose smooth (bilinear) or fast (nearest-neighbour) scaling for playback.
+        
+        Args:
+            enabled: True to always scale smoothly, False for fast scaling
+        """
+        self.smooth_scaling = enabled
+        if self._showing_frame:
+            self.update()
+
+    def _on_frame_settled(self):
+        """
+        Repaint the last frame with smooth scaling once frames stop arriving.
+        Re-arms for the remaining time if a frame arrived since the timer started,
+        and skips streams whose frames are SMOOTH_AFTER_MS or more apart (every
+        frame would otherwise be painted twice).
+        """
+        if not self._showing_frame or self.smooth_scaling:
+            return
+        
+        idle_ms = (time.monotonic_ns() - self._last_frame_ns) // 1_000_000
+        if idle_ms < self.SMOOTH_AFTER_MS:
+            self.smooth_timer.start(self.SMOOTH_AFTER_MS - idle_ms)
+            return
+        
+        if self._frame_interval_ns < self.SMOOTH_AFTER_MS * 1_000_000:
+            self._frame_settled = True
+            self.update()
+
     def set_connecting(self, is_connecting: bool):
         """
         Set connecting state and show/hide spinner.
@@ -168,45 +285,91 @@ class VideoWidget(QLabel):
         self.connecting_spinner_frame = 0
         if is_connecting:
             self._show_connecting_overlay()
+        self._update_spinner_timer()
+
+    def showEvent(self, event):
+        """Resume the spinner animation when the widget is shown or restored."""
+        super().showEvent(event)
+        self._shown = True
+        self._update_spinner_timer()
+
+    def hideEvent(self, event):
+        """Pause the spinner animation while hidden or minimized."""
+        super().hideEvent(event)
+        self._shown = False
+        self._update_spinner_timer()
+
+    def _update_spinner_timer(self):
+        """Run the spinner timer only while connecting and shown (not hidden or minimized)."""
+        if self.is_connecting and self._shown:
+            if not self.connecting_timer.isActive():
+                self.connecting_timer.start()
+        else:
+            self.connecting_timer.stop()
 
     def _update_spinner(self):
         """Update spinner animation frame."""
         if self.is_connecting:
-            self.connecting_spinner_frame = (self.connecting_spinner_frame + 1) % 4
+            self.connecting_spinner_frame = (self.connecting_spinner_frame + 1) % len(self.SPINNER_CHARS)
             self._show_connecting_overlay()
 
     def _show_connecting_overlay(self):
-        """Display connecting overlay with spinner."""
+        """Display connecting overlay with spinner (rendered once per size and spinner frame)."""
+        size = self.size()
+        if size != self._overlay_cache_size:
+            self._overlay_cache = [None] * len(self.SPINNER_CHARS)
+            self._overlay_cache_size = size
+        
+        overlay = self._overlay_cache[self.connecting_spinner_frame]
+        if overlay is None:
+            overlay = self._render_connecting_overlay(self.connecting_spinner_frame)
+            self._overlay_cache[self.connecting_spinner_frame] = overlay
+        
+        self._showing_frame = False
+        self.setPixmap(overlay)
+        self._frame_image = None
+        self._frame_ref = None
+        self.smooth_timer.stop()
+
+    def _render_connecting_overlay(self, spinner_frame: int) -> QPixmap:
+        """
+        Render the connecting overlay for one spinner frame at the current widget size.
+        
+        Args:
+            spinner_frame: Index into SPINNER_CHARS
+            
+        Returns:
+            Widget-sized overlay pixmap
+        """
+        width = self.width()
+        height = self.height()
+        
         # Create overlay pixmap
-        overlay = QPixmap(self.width(), self.height())
+        overlay = QPixmap(width, height)
         overlay.fill(QColor(0, 0, 0, 200))  # Semi-transparent black
         
         painter = QPainter(overlay)
         
         # Draw spinner animation
-        spinner_chars = ['⠋', '⠙', '⠹', '⠸']
-        spinner_text = spinner_chars[self.connecting_spinner_frame]
+        spinner_text = self.SPINNER_CHARS[spinner_frame]
         
-        font = QFont("Arial", 48)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setFont(self._spinner_font)
         painter.setPen(QColor("white"))
         
         # Draw spinner in center
         painter.drawText(
-            0, 0, self.width(), self.height() // 2,
+            0, 0, width, height // 2,
             Qt.AlignCenter | Qt.AlignBottom,
             spinner_text
         )
         
         # Draw "Connecting..." text
-        font.setPointSize(14)
-        painter.setFont(font)
+        painter.setFont(self._connecting_font)
         painter.drawText(
-            0, self.height() // 2, self.width(), self.height() // 2,
+            0, height // 2, width, height // 2,
             Qt.AlignCenter | Qt.AlignTop,
             "Connecting..."
         )
         
         painter.end()
-        self.setPixmap(overlay)
+        return overlay
@@ -2,7 +2,7 @@ import sys
 import os
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QObject, Slot
+from PySide6.QtCore import QObject, Qt, Slot, QTimer
 
 # Ensure src directory is on sys.path for module imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -13,6 +13,7 @@ from core.frame_buffer import FrameBuffer
 from gui.main_window import MainWindow
 from gui.error_display import ErrorDialog
 from utils.url_validator import URLValidator
+from utils import stream_kind
 from utils.logger import get_logger
 
 
@@ -28,16 +29,23 @@ class StreamController(QObject):
         super().__init__(window)
         self.window = window
         self.engine: RTSPStreamEngine | None = None
+        # Connection handles for the current engine's signals, disconnected by token on stop
+        self._engine_connections = []
         self.current_url: str | None = None
         self.logger = get_logger()
 
         # Single-frame buffer + watchdog
         self.frame_buffer = FrameBuffer()
-        self.frame_buffer.on_frame_ready = self._on_buffer_frame_ready
-        self.frame_buffer.on_timeout = self._on_frame_timeout
-
-        # Reconnection state machine
-        self.reconnect_manager = ReconnectionManager()
+        # frame_ready is emitted from the capture thread; queue it to the GUI thread
+        self.frame_buffer.signals.frame_ready.connect(self._on_buffer_frame_ready, Qt.QueuedConnection)
+        self.frame_buffer.signals.timeout.connect(self._on_frame_timeout)
+
+        # Reconnection state machine. The backoff delay runs on reconnect_timer
+        # instead of blocking the GUI thread inside connection_failed()
+        self.reconnect_manager = ReconnectionManager(wait_for_delay=False)
+        self.reconnect_timer = QTimer(self)
+        self.reconnect_timer.setSingleShot(True)
+        self.reconnect_timer.timeout.connect(self._start_engine)
         self.reconnect_manager.on_state_changed = self._on_state_changed
         self.reconnect_manager.on_reconnect_attempt = self._on_reconnect_attempt
         self.reconnect_manager.on_max_retries_exceeded = self._on_max_retries_exceeded
@@ -59,12 +67,15 @@ class StreamController(QObject):
         """
         raw_url = (url or "").strip()
 
-        # 1) Existing local file
-        is_local_path = os.path.exists(raw_url)
+        # 2) Local webcam (DirectShow / index) - string checks first
+        is_webcam = stream_kind.is_webcam(raw_url)
 
-        # 2) Local webcam (DirectShow / index)
-        lower_url = raw_url.lower()
-        is_webcam = lower_url.startswith("video=") or lower_url.isdigit()
+        # 1) Existing local file (no stat syscall for webcams and RTSP URLs)
+        is_local_path = (
+            not is_webcam
+            and not stream_kind.is_rtsp(raw_url)
+            and os.path.exists(raw_url)
+        )
 
         if not (is_local_path or is_webcam):
             # 3) Must be valid RTSP URL
@@ -100,10 +111,14 @@ class StreamController(QObject):
 
         self.engine = RTSPStreamEngine(self.current_url)
 
-        # Instead of feeding VideoWidget directly, pass through FrameBuffer
-        self.engine.frame_ready.connect(self._on_engine_frame)
-        self.engine.error_occurred.connect(self.on_engine_error)
-        self.engine.connection_established.connect(self.on_connection_established)
+        # Instead of feeding VideoWidget directly, pass through FrameBuffer.
+        # Direct connection: frames are published on the capture thread, and only
+        # the lightweight FrameBuffer.frame_ready notification crosses to the GUI.
+        self._engine_connections = [
+            self.engine.frame_ready.connect(self._on_engine_frame, Qt.DirectConnection),
+            self.engine.error_occurred.connect(self.on_engine_error),
+            self.engine.connection_established.connect(self.on_connection_established),
+        ]
 
         # Reset and use watchdog
         self.frame_buffer.clear()
@@ -119,28 +134,24 @@ class StreamController(QObject):
 
     def _stop_engine(self):
         """Stop and clean up the current stream engine."""
+        # Cancel any pending reconnection attempt
+        self.reconnect_timer.stop()
+
         # Stop watchdog
         self.frame_buffer.stop_watchdog()
-        self.frame_buffer.clear()
 
         if self.engine:
             # Disconnect signals to ensure no more frames arrive after stop
-            try:
-                self.engine.frame_ready.disconnect(self._on_engine_frame)
-            except Exception:
-                pass
-            try:
-                self.engine.error_occurred.disconnect(self.on_engine_error)
-            except Exception:
-                pass
-            try:
-                self.engine.connection_established.disconnect(self.on_connection_established)
-            except Exception:
-                pass
+            for connection in self._engine_connections:
+                QObject.disconnect(connection)
+            self._engine_connections = []
 
             self.engine.stop()
             self.engine = None
 
+        # No producer is left, so clearing cannot race with put_frame
+        self.frame_buffer.clear()
+
     # ---------- Engine signal handlers ----------
 
     @Slot(dict)
@@ -186,16 +197,19 @@ class StreamController(QObject):
     @Slot()
     def _on_buffer_frame_ready(self):
         """Called when FrameBuffer has a new frame ready for display."""
-        frame = self.frame_buffer.get_frame()
-        if frame is not None:
+        frame = self.frame_buffer.take_frame()
+        # Ignore notifications still queued from an engine that was stopped
+        if frame is not None and self.engine is not None:
             self.window.video_widget.display_frame(frame)
 
     @Slot(object)
     def _on_engine_frame(self, frame):
         """
         Receive frame from engine, push to FrameBuffer (Strict Latest Frame Policy).
+        Runs on the capture thread (direct connection).
+        Frames come straight from the decoder, so the unchecked fast path is used.
         """
-        self.frame_buffer.put_frame(frame)
+        self.frame_buffer.put_frame_unchecked(frame)
 
     # ---------- ReconnectionManager callbacks ----------
 
@@ -214,11 +228,14 @@ class StreamController(QObject):
     def _on_reconnect_attempt(self, attempt: int, wait_time: int):
         """
         Called by ReconnectionManager before next connection attempt.
-        After internal wait, arrange new start attempt.
+        Schedules the new start attempt after wait_time seconds.
         """
-        # Wait already performed inside ReconnectionManager, just try opening engine again
         self.logger.log_reconnect_attempt(attempt, wait_time)
-        if self.current_url:
+        if not self.current_url:
+            return
+        if wait_time > 0:
+            self.reconnect_timer.start(int(wait_time * 1000))
+        else:
             self._start_engine()
 
     def _on_max_retries_exceeded(self):
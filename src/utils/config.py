@@ -2,6 +2,7 @@
 Configuration - Application settings and constants.
 """
 
+import sys
 from pathlib import Path
 
 
@@ -22,7 +23,7 @@ class Config:
     # Frame Buffer Configuration
     FRAME_BUFFER_SIZE = 1  # Single-frame buffer (Latest Frame Policy)
     WATCHDOG_TIMEOUT = 2.5  # seconds - no frames timeout
-    WATCHDOG_CHECK_INTERVAL = 0.1  # seconds - check every 100ms
+    WATCHDOG_CHECK_INTERVAL = 0.1  # seconds - minimum interval between watchdog checks
     
     # Reconnection Configuration
     MAX_RECONNECTION_ATTEMPTS = 5
@@ -40,6 +41,20 @@ class Config:
     # Video Configuration
     SUPPORTED_CODECS = ["h264", "hevc", "h265", "mpeg4", "msmpeg4v3", "h263"]
     TARGET_PIXEL_FORMAT = "rgb24"
+    # Format of frames sent to the GUI: 32-bit xRGB in native byte order, which is
+    # QImage.Format_RGB32, so Qt displays it without converting every pixel
+    DISPLAY_PIXEL_FORMAT = "bgra" if sys.byteorder == "little" else "argb"
+    # Hardware decoding via FFmpeg's wrapper decoders, tried in order: NVDEC (cuvid),
+    # then Intel Quick Sync (qsv). Falls back to software if none can be opened.
+    USE_HW_DECODE = False
+    HW_DECODERS = {
+        "h264": ("h264_cuvid", "h264_qsv"),
+        "hevc": ("hevc_cuvid", "hevc_qsv"),
+    }
+    # Explicit FFmpeg decoder name (e.g. "h264_qsv"); overrides HW_DECODERS when set
+    VIDEO_DECODER = None
+    # Run the capture (decode) thread above normal priority where the OS allows it
+    RAISE_CAPTURE_PRIORITY = True
     STRICT_LATEST_FRAME = True  # Strict Latest Frame Policy (Req 6.7)
     
     # UI Configuration
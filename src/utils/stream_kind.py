@@ -0,0 +1,34 @@
+"""
+Stream Kind - Classifies user input as webcam device or RTSP URL.
+Shared by the GUI, controller, validator and engine so they agree on the rules.
+"""
+
+
+def is_webcam(url: str) -> bool:
+    """
+    Check whether input names a local webcam.
+
+    Webcams are given as "video=<device name>" or a device index. The prefix is
+    case-sensitive: FFmpeg's dshow input only accepts lowercase "video=".
+
+    Args:
+        url: Stripped user input
+
+    Returns:
+        True if input is a webcam identifier
+    """
+    return url.startswith("video=") or url.isdigit()
+
+
+def is_rtsp(url: str) -> bool:
+    """
+    Check whether input is an RTSP URL. Like the webcam prefix, the scheme is
+    case-sensitive: FFmpeg only recognises lowercase "rtsp://".
+
+    Args:
+        url: Stripped user input
+
+    Returns:
+        True if input starts with rtsp://
+    """
+    return url.startswith("rtsp://")
@@ -4,10 +4,12 @@ Supports flexible RTSP URL formats including credentials, optional port, and opt
 """
 
 import re
+from functools import lru_cache
 from typing import Tuple
 from urllib.parse import urlparse
 from pathlib import Path
 from .config import Config
+from . import stream_kind
 
 
 class URLValidator:
@@ -19,6 +21,8 @@ class URLValidator:
     # - Optional path
     # Pattern: rtsp://[user:pass@]host[:port][/path]
     RTSP_PATTERN = r'^rtsp://(?:(?:[^:@]+):(?:[^@]+)@)?(?:[a-zA-Z0-9\-\.]+|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})(?::\d+)?(?:/.*)?$'
+    # Case-sensitive: FFmpeg only recognises the lowercase rtsp:// scheme
+    RTSP_REGEX = re.compile(RTSP_PATTERN)
 
     @staticmethod
     def validate(url: str) -> Tuple[bool, str]:
@@ -43,7 +47,7 @@ class URLValidator:
         url = url.strip()
 
         # Check if it's a webcam identifier (video= or just a digit)
-        if url.startswith('video=') or url.isdigit():
+        if stream_kind.is_webcam(url):
             # Webcam identifiers are always valid (actual availability checked at connection time)
             return True, ""
 
@@ -53,8 +57,9 @@ class URLValidator:
             if url.lower().startswith(protocol):
                 return False, f"Unsupported protocol. Only RTSP streams are supported. Use rtsp:// instead of {protocol}"
 
-        # Check if it's a local file path
-        if not url.lower().startswith('rtsp://'):
+        # Check if it's a local file path (a wrong-case "RTSP://" still goes to the
+        # RTSP check below, which rejects it)
+        if url[:7].lower() != "rtsp://":
             # Treat as local file path - check if it looks like a file path
             # File paths typically contain: \ or / or : (drive letter) or have file extension
             looks_like_path = ('/' in url or '\\' in url or ':' in url or '.' in url)
@@ -85,8 +90,23 @@ class URLValidator:
                 # Path is invalid or inaccessible
                 return False, f"Invalid file path: {url}"
 
-        # RTSP URL validation
-        if not re.match(URLValidator.RTSP_PATTERN, url, re.IGNORECASE):
+        # RTSP URL validation (pure string checks, cached per URL)
+        return URLValidator._validate_rtsp(url)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _validate_rtsp(url: str) -> Tuple[bool, str]:
+        """
+        Validate the format of an RTSP URL. Depends only on the string,
+        so results are cached for repeated Play clicks on the same URL.
+        
+        Args:
+            url: Stripped URL starting with rtsp:// in any case (only lowercase is valid)
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        if not URLValidator.RTSP_REGEX.match(url):
             return False, "Invalid RTSP URL format. Expected: rtsp://[user:pass@]host[:port][/path]"
 
         # Additional validation using urllib.parse
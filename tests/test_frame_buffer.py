@@ -0,0 +1,200 @@
+"""Unit tests for FrameBuffer."""
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import gc
+import threading
+import time
+import unittest
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer, Qt
+from core.frame_buffer import FrameBuffer, _WatchdogScheduler
+from utils.config import Config
+
+
+def _frame(value: int = 0) -> np.ndarray:
+    """Small BGRA frame filled with a marker value."""
+    return np.full((2, 2, 4), value, dtype=np.uint8)
+
+
+class TestFrameBuffer(unittest.TestCase):
+    """Test cases for FrameBuffer notification coalescing and double buffer."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the Qt application needed for signal delivery."""
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.buffer = FrameBuffer()
+        self.notifications = 0
+        self.buffer.signals.frame_ready.connect(self._on_frame_ready)
+
+    def _on_frame_ready(self):
+        self.notifications += 1
+
+    def test_empty_buffer(self):
+        """Test a new buffer has no frame and no dropped frames."""
+        self.assertIsNone(self.buffer.get_frame())
+        self.assertIsNone(self.buffer.take_frame())
+        self.assertEqual(self.buffer.frames_dropped, 0)
+
+    def test_one_notification_per_burst(self):
+        """Test a burst of frames sends a single frame_ready until taken."""
+        for value in range(5):
+            self.buffer.put_frame(_frame(value))
+
+        self.assertEqual(self.notifications, 1)
+        # Latest Frame Policy: the newest frame wins
+        self.assertEqual(self.buffer.get_frame()[0, 0, 0], 4)
+
+    def test_take_frame_rearms_notification(self):
+        """Test take_frame() re-arms frame_ready for the next frame."""
+        first = _frame(1)
+        self.buffer.put_frame(first)
+        self.assertIs(self.buffer.take_frame(), first)
+
+        self.buffer.put_frame(_frame(2))
+        self.assertEqual(self.notifications, 2)
+
+    def test_get_frame_does_not_rearm(self):
+        """Test get_frame() peeks without re-arming frame_ready."""
+        self.buffer.put_frame(_frame(1))
+        self.buffer.get_frame()
+        self.buffer.put_frame(_frame(2))
+        self.assertEqual(self.notifications, 1)
+
+    def test_dropped_frames_counted(self):
+        """Test frames overwritten before take_frame() are counted as dropped."""
+        for value in range(3):
+            self.buffer.put_frame(_frame(value))
+        self.buffer.take_frame()
+        self.buffer.put_frame(_frame(3))
+
+        self.assertEqual(self.buffer.frames_dropped, 2)
+        self.assertEqual(self.buffer.get_buffer_stats()["frames_dropped"], 2)
+
+    def test_clear(self):
+        """Test clear() empties both slots but keeps the drop counter."""
+        self.buffer.put_frame(_frame(1))
+        self.buffer.put_frame(_frame(2))
+        self.buffer.clear()
+
+        self.assertIsNone(self.buffer.get_frame())
+        self.assertIsNone(self.buffer.take_frame())
+        self.assertFalse(self.buffer.get_buffer_stats()["has_frame"])
+        self.assertEqual(self.buffer.frames_dropped, 1)
+
+    def test_threaded_producer_queued_consumer(self):
+        """Test every frame from a worker thread is either notified or counted as dropped."""
+        buffer = FrameBuffer()
+        taken = []
+        buffer.signals.frame_ready.connect(lambda: taken.append(buffer.take_frame()), Qt.QueuedConnection)
+        frame_count = 500
+        frames = [_frame(value % 256) for value in range(frame_count)]
+
+        def produce():
+            for frame in frames:
+                buffer.put_frame_unchecked(frame)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        while producer.is_alive():
+            QCoreApplication.processEvents()
+        producer.join()
+        QCoreApplication.processEvents()
+
+        self.assertEqual(len(taken) + buffer.frames_dropped, frame_count)
+        self.assertIs(taken[-1], frames[-1])
+
+
+class TestWatchdogScheduler(unittest.TestCase):
+    """Test cases for the shared watchdog timer."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the Qt application needed for the shared QTimer."""
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.buffers = []
+        self.timeouts = []
+
+    def tearDown(self):
+        """Unregister every buffer so the next test starts with an idle scheduler."""
+        for buffer in self.buffers:
+            buffer.stop_watchdog()
+
+    def _watched_buffer(self, frame_age: float = 0.0) -> FrameBuffer:
+        """Start watching a new buffer whose last frame arrived frame_age seconds ago."""
+        buffer = FrameBuffer()
+        buffer.signals.timeout.connect(lambda: self.timeouts.append(buffer))
+        buffer.start_watchdog()
+        buffer.last_frame_time_ns = time.monotonic_ns() - int(frame_age * 1e9)
+        self.buffers.append(buffer)
+        return buffer
+
+    def _run_event_loop(self, ms: int):
+        loop = QEventLoop()
+        QTimer.singleShot(ms, loop.quit)
+        loop.exec()
+
+    def test_timer_armed_for_earliest_deadline(self):
+        """Test the shared timer is armed for the earliest deadline of all buffers."""
+        self._watched_buffer()
+        self._watched_buffer(frame_age=Config.WATCHDOG_TIMEOUT - 0.5)
+        _WatchdogScheduler._reschedule()
+        # interval() is the armed delay (remainingTime() includes coarse-timer slack)
+        self.assertTrue(450 <= _WatchdogScheduler._timer.interval() <= 500)
+
+        self._watched_buffer(frame_age=Config.WATCHDOG_TIMEOUT - 0.3)
+        _WatchdogScheduler._reschedule()
+        self.assertTrue(250 <= _WatchdogScheduler._timer.interval() <= 300)
+
+    def test_overdue_deadline_uses_minimum_interval(self):
+        """Test an overdue deadline re-arms no sooner than the check interval."""
+        self._watched_buffer(frame_age=10.0)
+        _WatchdogScheduler._reschedule()
+        self.assertEqual(_WatchdogScheduler._timer.interval(), int(Config.WATCHDOG_CHECK_INTERVAL * 1000))
+
+    def test_timeout_fires_once(self):
+        """Test a stalled buffer times out exactly once and a live one not at all."""
+        stalled = self._watched_buffer(frame_age=Config.WATCHDOG_TIMEOUT)
+        self._watched_buffer()
+        _WatchdogScheduler._reschedule()
+
+        self._run_event_loop(500)
+        self.assertEqual(self.timeouts, [stalled])
+
+    def test_stop_watchdog_unregisters(self):
+        """Test stop_watchdog() unregisters the buffer and stops the idle timer."""
+        first = self._watched_buffer()
+        second = self._watched_buffer()
+
+        first.stop_watchdog()
+        self.assertEqual([ref() for ref in _WatchdogScheduler._buffers], [second])
+        self.assertTrue(_WatchdogScheduler._timer.isActive())
+
+        second.stop_watchdog()
+        self.assertEqual(_WatchdogScheduler._buffers, [])
+        self.assertFalse(_WatchdogScheduler._timer.isActive())
+
+    def test_collected_buffer_is_pruned(self):
+        """Test a garbage-collected buffer is dropped from the scheduler on the next tick."""
+        survivor = self._watched_buffer()
+        buffer = FrameBuffer()
+        buffer.start_watchdog()
+        del buffer
+        gc.collect()
+
+        _WatchdogScheduler._on_tick()
+        self.assertEqual([ref() for ref in _WatchdogScheduler._buffers], [survivor])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import threading
 import unittest
 import time
 from core.reconnection_manager import ReconnectionManager, StreamState
@@ -23,6 +24,10 @@ class TestReconnectionManager(unittest.TestCase):
         self.manager.on_reconnect_attempt = lambda attempt, delay: self.reconnect_attempts.append((attempt, delay))
         self.manager.on_max_retries_exceeded = lambda: self._set_max_retries_called()
 
+    def tearDown(self):
+        """Reset the process-wide shutdown flag between tests."""
+        ReconnectionManager.reset_shutdown()
+
     def _set_max_retries_called(self):
         """Helper to set max retries flag."""
         self.max_retries_called = True
@@ -105,7 +110,6 @@ class TestReconnectionManager(unittest.TestCase):
         self.manager.start_connection()
         
         # Start connection failure in background (would normally wait)
-        import threading
         def fail_connection():
             self.manager.connection_failed("Test error")
         
@@ -122,6 +126,37 @@ class TestReconnectionManager(unittest.TestCase):
         # Should complete quickly (< 1 second) instead of waiting full delay
         self.assertLess(elapsed, 1.0)
 
+    def test_shutdown_all_interrupts_wait(self):
+        """Test process-wide shutdown interrupts a pending reconnection delay."""
+        self.manager.start_connection()
+        self.manager.attempt_count = 1  # Next failure uses the 2s delay
+
+        thread = threading.Thread(target=self.manager.connection_failed, args=("Test error",))
+        start_time = time.time()
+        thread.start()
+
+        time.sleep(0.1)
+        ReconnectionManager.shutdown_all()
+        thread.join(timeout=1.0)
+
+        self.assertFalse(thread.is_alive())
+        self.assertLess(time.time() - start_time, 1.0)
+
+    def test_no_wait_for_delay_returns_immediately(self):
+        """Test a manager without wait_for_delay leaves the delay to the caller."""
+        manager = ReconnectionManager(wait_for_delay=False)
+        attempts = []
+        manager.on_reconnect_attempt = lambda attempt, delay: attempts.append((attempt, delay))
+        manager.start_connection()
+        manager.attempt_count = 1  # Next failure uses the 2s delay
+
+        start_time = time.time()
+        manager.connection_failed("Test error")
+
+        self.assertLess(time.time() - start_time, 0.5)
+        self.assertEqual(attempts, [(2, 2)])
+        self.assertEqual(manager.get_state(), StreamState.CONNECTING)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,46 @@
+"""Unit tests for stream kind classification."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import unittest
+from utils import stream_kind
+
+
+class TestStreamKind(unittest.TestCase):
+    """Test cases for stream_kind helpers."""
+
+    def test_webcam_video_prefix(self):
+        """Test webcam identifier with video= prefix."""
+        self.assertTrue(stream_kind.is_webcam("video=Integrated Camera"))
+
+    def test_webcam_prefix_case_sensitive(self):
+        """Test upper-case VIDEO= is not a webcam (dshow only accepts video=)."""
+        self.assertFalse(stream_kind.is_webcam("VIDEO=0"))
+
+    def test_webcam_device_index(self):
+        """Test webcam identifier as device index."""
+        self.assertTrue(stream_kind.is_webcam("0"))
+        self.assertTrue(stream_kind.is_webcam("12"))
+
+    def test_rtsp_url_with_video_query_is_not_webcam(self):
+        """Test that video= inside an RTSP URL does not mark it as a webcam."""
+        url = "rtsp://192.168.1.100/stream?video=1"
+        self.assertFalse(stream_kind.is_webcam(url))
+        self.assertTrue(stream_kind.is_rtsp(url))
+
+    def test_rtsp_scheme_case_sensitive(self):
+        """Test RTSP scheme detection requires lowercase rtsp:// (FFmpeg is case-sensitive)."""
+        self.assertTrue(stream_kind.is_rtsp("rtsp://camera.local/live"))
+        self.assertFalse(stream_kind.is_rtsp("RTSP://camera.local/live"))
+        self.assertFalse(stream_kind.is_rtsp("http://camera.local/live"))
+        self.assertFalse(stream_kind.is_rtsp("C:/Videos/rtsp.mp4"))
+
+    def test_empty_input(self):
+        """Test empty input is neither webcam nor RTSP."""
+        self.assertFalse(stream_kind.is_webcam(""))
+        self.assertFalse(stream_kind.is_rtsp(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -72,6 +72,12 @@ class TestURLValidator(unittest.TestCase):
         # Error message should indicate format issue
         self.assertIn("format", error.lower())
 
+    def test_invalid_uppercase_rtsp_scheme(self):
+        """Test RTSP URL with an upper-case scheme (FFmpeg only accepts rtsp://)."""
+        is_valid, error = URLValidator.validate("RTSP://192.168.1.100:554/stream")
+        self.assertFalse(is_valid)
+        self.assertIn("format", error.lower())
+
     def test_local_file_path_not_found(self):
         """Test local file path that doesn't exist."""
         is_valid, error = URLValidator.validate("C:\\Videos\\nonexistent.mp4")
@@ -108,6 +114,35 @@ class TestURLValidator(unittest.TestCase):
             if os.path.exists(tmp_path):
                 os.unlink(tmp_path)
 
+    def test_local_file_created_after_failed_validation(self):
+        """Test that file checks are not cached across validations."""
+        tmp_dir = tempfile.mkdtemp()
+        tmp_path = os.path.join(tmp_dir, "later.mp4")
+        
+        try:
+            is_valid, _ = URLValidator.validate(tmp_path)
+            self.assertFalse(is_valid)
+            
+            open(tmp_path, "wb").close()
+            is_valid, error = URLValidator.validate(tmp_path)
+            self.assertTrue(is_valid)
+            self.assertEqual(error, "")
+        finally:
+            # Clean up
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            os.rmdir(tmp_dir)
+
+    def test_rtsp_repeated_validation(self):
+        """Test that repeated RTSP validation is served from the cache."""
+        URLValidator._validate_rtsp.cache_clear()
+        url = "rtsp://192.168.1.100:99999/stream"
+        first = URLValidator.validate(url)
+        hits = URLValidator._validate_rtsp.cache_info().hits
+        self.assertEqual(URLValidator.validate(url), first)
+        self.assertGreater(URLValidator._validate_rtsp.cache_info().hits, hits)
+        self.assertFalse(first[0])
+
     def test_webcam_identifier_video_prefix(self):
         """Test webcam identifier with video= prefix."""
         is_valid, error = URLValidator.validate("video=Integrated Camera")